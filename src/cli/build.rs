@@ -38,38 +38,32 @@ pub fn run(path: &Path, force: bool, quiet: bool) -> Result<()> {
         }
         build_index(&build_path, quiet)?;
     } else if index_exists(&build_path) {
-        // Incremental update
+        // Incremental update: stat-only scan, then read and hash every file
+        // (an explicit build doesn't trust mtimes), updating changed ones in
+        // the same pass. Search-time auto-update only hashes mtime changes.
         if !quiet {
             eprint!("Scanning files...");
         }
-        let files = walker::scan(&build_path)?;
+        let metadata = walker::scan_metadata(&build_path)?;
         if !quiet {
             eprintln!("\r                 \r");
         }
 
         let index = SemanticIndex::new(&build_path, None)?;
-        let stale_result = index.get_stale_files(&files);
-
-        match stale_result {
-            Ok((changed, deleted)) => {
-                let stale_count = changed.len() + deleted.len();
-                if stale_count == 0 {
-                    if !quiet {
-                        eprintln!("Index up to date");
-                    }
-                } else {
-                    if !quiet {
-                        eprint!("Updating {stale_count} files...");
-                    }
-                    let stats = index.update(&files)?;
-                    if !quiet {
-                        eprintln!(
-                            "\rUpdated {} blocks from {} files        ",
-                            stats.blocks, stats.files
-                        );
-                        if stats.deleted > 0 {
-                            eprintln!("  Removed {} stale blocks", stats.deleted);
-                        }
+        match index.verify_and_update(&metadata) {
+            Ok((_, None)) => {
+                if !quiet {
+                    eprintln!("Index up to date");
+                }
+            }
+            Ok((stale_count, Some(stats))) => {
+                if !quiet {
+                    eprintln!(
+                        "Updated {} blocks from {} files ({stale_count} changed)",
+                        stats.blocks, stats.files
+                    );
+                    if stats.deleted > 0 {
+                        eprintln!("  Removed {} stale blocks", stats.deleted);
                     }
                 }
             }
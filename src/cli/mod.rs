@@ -38,6 +38,10 @@ pub struct Cli {
     #[arg(short = 'j', long = "json")]
     json: bool,
 
+    /// JSON Lines output (one result per line).
+    #[arg(long = "jsonl")]
+    jsonl: bool,
+
     /// List files only.
     #[arg(short = 'l', long = "files-only")]
     files_only: bool,
@@ -70,9 +74,23 @@ pub struct Cli {
     #[arg(short = 'C', long = "context", default_value = "5")]
     context_lines: usize,
 
+    /// Cut results at the first score drop larger than this fraction of the top score.
+    #[arg(
+        long = "elbow",
+        value_name = "DELTA",
+        num_args = 0..=1,
+        require_equals = true,
+        default_missing_value = "0.15"
+    )]
+    elbow: Option<f32>,
+
     /// Filter results by regex (applied to content and name).
     #[arg(short = 'e', long = "regex")]
     regex: Option<String>,
+
+    /// Reuse results of an identical earlier search until the index changes.
+    #[arg(long = "cache-results")]
+    cache_results: bool,
 }
 
 #[derive(Subcommand)]
@@ -138,6 +156,15 @@ enum ModelAction {
 
 /// Main CLI entry point.
 pub fn run() -> anyhow::Result<()> {
+    // `og --version` alone needs no command tree: answer before clap builds one
+    let mut args = std::env::args_os().skip(1);
+    if let (Some(arg), None) = (args.next(), args.next()) {
+        if arg == "--version" || arg == "-V" {
+            println!("og {}", env!("CARGO_PKG_VERSION"));
+            return Ok(());
+        }
+    }
+
     let cli = Cli::parse();
 
     match cli.command {
@@ -165,6 +192,7 @@ pub fn run() -> anyhow::Result<()> {
             threshold: cli.threshold,
             format: crate::types::OutputFormat::from_flags(
                 cli.json,
+                cli.jsonl,
                 cli.files_only,
                 cli.no_content,
             ),
@@ -175,6 +203,8 @@ pub fn run() -> anyhow::Result<()> {
             no_index: cli.no_index,
             context_lines: cli.context_lines,
             regex: cli.regex.as_deref(),
+            elbow: cli.elbow,
+            cache_results: cli.cache_results,
         }),
     }
 }
@@ -1,15 +1,11 @@
 use anyhow::Result;
 use hf_hub::api::sync::Api;
-use hf_hub::Cache;
 
 use crate::embedder;
 
 pub fn status() -> Result<()> {
     let config = embedder::MODEL;
-    let cache = Cache::default();
-    let repo = cache.model(config.repo.to_string());
-    let installed =
-        repo.get(config.model_file).is_some() && repo.get(config.tokenizer_file).is_some();
+    let installed = embedder::cached_model_files(config).is_some();
     let marker = if installed {
         "installed"
     } else {
@@ -27,8 +23,21 @@ pub fn install() -> Result<()> {
 
     println!("Downloading {}...", config.repo);
 
-    for filename in [config.model_file, config.tokenizer_file] {
-        match repo.get(filename) {
+    // Both files download concurrently; report in a stable order afterwards
+    let files = [config.model_file, config.tokenizer_file];
+    let downloads: Vec<_> = std::thread::scope(|s| {
+        let handles: Vec<_> = files
+            .iter()
+            .map(|&filename| s.spawn(|| repo.get(filename)))
+            .collect();
+        handles
+            .into_iter()
+            .map(|h| h.join().expect("download thread panicked"))
+            .collect()
+    });
+
+    for (filename, download) in files.into_iter().zip(downloads) {
+        match download {
             Ok(path) => {
                 println!("  {filename} -> {}", path.display());
             }
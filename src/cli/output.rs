@@ -1,106 +1,220 @@
-use std::path::Path;
+use std::io::{self, BufWriter, IsTerminal, Write};
+use std::path::{Path, MAIN_SEPARATOR};
+
+use owo_colors::{OwoColorize, Style};
+use serde::Serialize;
 
 use crate::types::{OutputFormat, SearchResult};
 
-/// Print search results in the specified format.
+/// Print search results in the specified format. With `root`, result paths
+/// are rewritten relative to it in place.
+///
+/// All output goes through one buffered, locked stdout handle, so a result
+/// set costs a handful of write syscalls instead of one per line. Write
+/// errors (e.g. a closed pipe from `og ... | head`) are ignored.
 pub fn print_results(
-    results: &[SearchResult],
+    results: &mut [SearchResult],
     format: OutputFormat,
     show_score: bool,
     root: Option<&Path>,
     context_lines: usize,
 ) {
-    let results: Vec<SearchResult> = results
-        .iter()
-        .map(|r| {
-            let mut r = r.clone();
-            if let Some(root) = root {
-                if let Ok(rel) = Path::new(&r.file).strip_prefix(root) {
-                    r.file = rel.to_string_lossy().into_owned();
-                }
+    if let Some(root) = root {
+        relativize(results, root);
+    }
+
+    let stdout = io::stdout();
+    let mut out = BufWriter::new(stdout.lock());
+
+    let _ = match format {
+        OutputFormat::FilesOnly => print_files_only(&mut out, results),
+        OutputFormat::Json => print_json(&mut out, results, false),
+        OutputFormat::JsonLines => print_json_lines(&mut out, results),
+        OutputFormat::NoContent => print_json(&mut out, results, true),
+        OutputFormat::Default => {
+            let palette = Palette::detect();
+            if show_score {
+                print_default::<true>(&mut out, results, context_lines, &palette)
+            } else {
+                print_default::<false>(&mut out, results, context_lines, &palette)
             }
-            r
-        })
-        .collect();
-
-    match format {
-        OutputFormat::FilesOnly => print_files_only(&results),
-        OutputFormat::Json => print_json(&results, false),
-        OutputFormat::NoContent => print_json(&results, true),
-        OutputFormat::Default => print_default(&results, show_score, context_lines),
+        }
+    }
+    .and_then(|()| out.flush());
+}
+
+/// Rewrite result paths relative to `root`, in place.
+///
+/// Results under `root` share its string prefix, so stripping that is enough;
+/// `Path::strip_prefix` (component-wise) is only the fallback for paths that
+/// spell the root differently.
+fn relativize(results: &mut [SearchResult], root: &Path) {
+    let root_str = root.to_string_lossy();
+    let prefix = format!(
+        "{}{MAIN_SEPARATOR}",
+        root_str.trim_end_matches(MAIN_SEPARATOR)
+    );
+    for r in results {
+        if r.file.starts_with(&prefix) {
+            r.file.replace_range(..prefix.len(), "");
+        } else if let Ok(rel) = Path::new(&r.file).strip_prefix(root) {
+            r.file = rel.to_string_lossy().into_owned();
+        }
+    }
+}
+
+/// Styles for default output. All plain when stdout is not a terminal or
+/// `NO_COLOR` is set (non-empty), so piped output carries no ANSI escapes.
+struct Palette {
+    file: Style,
+    line: Style,
+    block_type: Style,
+    name: Style,
+    preview: Style,
+}
+
+impl Palette {
+    fn detect() -> Self {
+        let no_color = std::env::var_os("NO_COLOR").is_some_and(|v| !v.is_empty());
+        if io::stdout().is_terminal() && !no_color {
+            Self {
+                file: Style::new().cyan(),
+                line: Style::new().yellow(),
+                block_type: Style::new().dimmed(),
+                name: Style::new().bold(),
+                preview: Style::new().dimmed(),
+            }
+        } else {
+            Self {
+                file: Style::new(),
+                line: Style::new(),
+                block_type: Style::new(),
+                name: Style::new(),
+                preview: Style::new(),
+            }
+        }
     }
 }
 
-fn print_files_only(results: &[SearchResult]) {
-    let mut seen = std::collections::HashSet::new();
+fn print_files_only(out: &mut impl Write, results: &[SearchResult]) -> io::Result<()> {
+    // First occurrence wins, so files keep their best-ranked order
+    let mut seen = std::collections::HashSet::with_capacity(results.len());
     for r in results {
-        if seen.insert(&r.file) {
-            println!("{}", r.file);
+        if seen.insert(r.file.as_str()) {
+            writeln!(out, "{}", r.file)?;
         }
     }
+    Ok(())
 }
 
-fn print_json(results: &[SearchResult], compact: bool) {
+/// SearchResult without its content, borrowed for serialization.
+/// Field order matches SearchResult so both JSON formats line up.
+#[derive(Serialize)]
+struct NoContentResult<'a> {
+    file: &'a str,
+    #[serde(rename = "type")]
+    block_type: &'a str,
+    name: &'a str,
+    line: usize,
+    end_line: usize,
+    score: f32,
+}
+
+impl<'a> From<&'a SearchResult> for NoContentResult<'a> {
+    fn from(r: &'a SearchResult) -> Self {
+        Self {
+            file: &r.file,
+            block_type: &r.block_type,
+            name: &r.name,
+            line: r.line,
+            end_line: r.end_line,
+            score: r.score,
+        }
+    }
+}
+
+/// Serialize straight into the buffered writer: no intermediate String,
+/// and no serde_json::Value tree for the no-content format.
+fn print_json(out: &mut impl Write, results: &[SearchResult], compact: bool) -> io::Result<()> {
     if compact {
-        let output: Vec<serde_json::Value> = results
-            .iter()
-            .map(|r| {
-                let mut v = serde_json::to_value(r).unwrap_or_default();
-                if let Some(obj) = v.as_object_mut() {
-                    obj.remove("content");
-                }
-                v
-            })
-            .collect();
-        println!(
-            "{}",
-            serde_json::to_string_pretty(&output).unwrap_or_default()
-        );
+        let view: Vec<NoContentResult> = results.iter().map(NoContentResult::from).collect();
+        serde_json::to_writer_pretty(&mut *out, &view)?;
     } else {
-        println!(
-            "{}",
-            serde_json::to_string_pretty(results).unwrap_or_default()
-        );
+        serde_json::to_writer_pretty(&mut *out, results)?;
     }
+    writeln!(out)
 }
 
-fn print_default(results: &[SearchResult], show_score: bool, context_lines: usize) {
-    use owo_colors::OwoColorize;
+/// One compact JSON object per line, written as each result is serialized.
+fn print_json_lines(out: &mut impl Write, results: &[SearchResult]) -> io::Result<()> {
+    for r in results {
+        serde_json::to_writer(&mut *out, r)?;
+        writeln!(out)?;
+    }
+    Ok(())
+}
 
+/// Monomorphized on `SHOW_SCORE`, chosen once per call, so the row loop
+/// carries no per-result check for it.
+fn print_default<const SHOW_SCORE: bool>(
+    out: &mut impl Write,
+    results: &[SearchResult],
+    context_lines: usize,
+    palette: &Palette,
+) -> io::Result<()> {
     for r in results {
-        let line_num = r.line.to_string();
-
-        if show_score {
-            println!(
-                "{}:{} {} {} (score: {:.3})",
-                r.file.cyan(),
-                line_num.yellow(),
-                r.block_type.dimmed(),
-                r.name.bold(),
-                r.score
-            );
-        } else {
-            println!(
-                "{}:{} {} {}",
-                r.file.cyan(),
-                line_num.yellow(),
-                r.block_type.dimmed(),
-                r.name.bold()
-            );
+        write!(
+            out,
+            "{}:{} {} {}",
+            r.file.style(palette.file),
+            r.line.style(palette.line),
+            r.block_type.style(palette.block_type),
+            r.name.style(palette.name)
+        )?;
+        if SHOW_SCORE {
+            write!(out, " (score: {:.3})", r.score)?;
         }
+        writeln!(out)?;
 
         if context_lines > 0 {
             if let Some(content) = &r.content {
-                let preview_lines: Vec<&str> = content
+                let preview_lines = content
                     .lines()
                     .filter(|l| !l.trim().is_empty())
-                    .take(context_lines)
-                    .collect();
+                    .take(context_lines);
                 for line in preview_lines {
-                    println!("  {}", line.dimmed());
+                    writeln!(out, "  {}", line.style(palette.preview))?;
                 }
-                println!();
+                writeln!(out)?;
             }
         }
     }
+    Ok(())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn relativize_strips_root() {
+        let mut results = vec![
+            SearchResult::in_file("/repo/src/lib.rs"),
+            SearchResult::in_file("/repo/src/main.rs"),
+            SearchResult::in_file("/other/x.rs"),
+            SearchResult::in_file("/repository/y.rs"),
+        ];
+        relativize(&mut results, Path::new("/repo/"));
+
+        let files: Vec<&str> = results.iter().map(|r| r.file.as_str()).collect();
+        assert_eq!(
+            files,
+            [
+                "src/lib.rs",
+                "src/main.rs",
+                "/other/x.rs",
+                "/repository/y.rs"
+            ]
+        );
+    }
 }
@@ -1,7 +1,9 @@
+use std::collections::HashSet;
 use std::path::Path;
-use std::time::Instant;
+use std::time::{Duration, Instant};
 
-use anyhow::{bail, Result};
+use anyhow::{bail, Context, Result};
+use globset::{GlobBuilder, GlobSet, GlobSetBuilder};
 
 use crate::boost::boost_results;
 use crate::cli::output::print_results;
@@ -21,6 +23,8 @@ pub struct SearchParams<'a> {
     pub no_index: bool,
     pub context_lines: usize,
     pub regex: Option<&'a str>,
+    pub elbow: Option<f32>,
+    pub cache_results: bool,
 }
 
 pub fn run(params: &SearchParams) -> Result<()> {
@@ -42,14 +46,11 @@ pub fn run(params: &SearchParams) -> Result<()> {
         );
     }
 
-    let path = params
-        .path
-        .canonicalize()
-        .unwrap_or_else(|_| params.path.to_path_buf());
-    if !path.exists() {
-        eprintln!("Path does not exist: {}", path.display());
+    // canonicalize fails for a missing path, so it doubles as the existence check
+    let Ok(path) = params.path.canonicalize() else {
+        eprintln!("Path does not exist: {}", params.path.display());
         std::process::exit(EXIT_ERROR);
-    }
+    };
 
     // Walk up to find existing index
     let (index_root, existing_index) = index::find_index_root(&path);
@@ -78,15 +79,25 @@ pub fn run(params: &SearchParams) -> Result<()> {
     };
 
     let mut index = SemanticIndex::new(&index_root, None)?;
+    index.set_cache_results(params.cache_results);
 
-    if !params.no_index {
-        // Auto-update stale files using metadata-only scan (no content reads)
-        if !params.quiet && index_root != path {
-            eprintln!("Using index at {}", index_root.display());
-        }
+    if !params.quiet && index_root != path {
+        eprintln!("Using index at {}", index_root.display());
+    }
 
+    // A freshly auto-built index is current: skip the second walk of the tree.
+    // So is one checked moments ago, when OG_CHECK_INTERVAL allows it.
+    let interval = check_interval();
+    if !params.no_index
+        && existing_index.is_some()
+        && !interval.is_some_and(|w| index.checked_within(w))
+    {
+        // Auto-update stale files using metadata-only scan (no content reads)
         let metadata = walker::scan_metadata(&index_root)?;
         let (stale_count, stats) = index.check_and_update(&metadata)?;
+        if interval.is_some() {
+            index.mark_checked();
+        }
 
         if stale_count > 0 && !params.quiet {
             if let Some(stats) = &stats {
@@ -103,26 +114,28 @@ pub fn run(params: &SearchParams) -> Result<()> {
     }
 
     // Run search
-    if !params.quiet {
-        eprint!("Searching...");
-    }
-    let t0 = Instant::now();
     index.set_search_scope(Some(&path));
-    let mut results = index.search(query, params.num_results)?;
-    let search_time = t0.elapsed();
-    if !params.quiet {
-        eprintln!("\r              \r");
-    }
+    let (results, search_time) = timed_status((!params.quiet).then_some("Searching..."), || {
+        index.search(query, params.num_results)
+    });
+    let mut results = results?;
 
     if results.is_empty() {
-        if !matches!(params.format, OutputFormat::Json) {
+        if !matches!(params.format, OutputFormat::Json | OutputFormat::JsonLines) {
             eprintln!("No results found");
         }
         std::process::exit(EXIT_NO_MATCH);
     }
 
     // Filter results
-    results = filter_results(results, params.file_types, params.exclude, params.code_only);
+    let excludes = match compile_excludes(params.exclude, params.code_only) {
+        Ok(excludes) => excludes,
+        Err(e) => {
+            eprintln!("{e:#}");
+            std::process::exit(EXIT_ERROR);
+        }
+    };
+    results = filter_results(results, params.file_types, excludes.as_ref(), &path);
     boost_results(&mut results, query);
 
     // Filter by threshold
@@ -130,6 +143,10 @@ pub fn run(params: &SearchParams) -> Result<()> {
         results.retain(|r| r.score >= params.threshold);
     }
 
+    if let Some(delta) = params.elbow {
+        elbow_cut(&mut results, delta);
+    }
+
     // Regex filter
     if let Some(pattern) = params.regex {
         match regex::Regex::new(pattern) {
@@ -146,14 +163,19 @@ pub fn run(params: &SearchParams) -> Result<()> {
     }
 
     print_results(
-        &results,
+        &mut results,
         params.format,
         false,
         Some(&path),
         params.context_lines,
     );
 
-    if !params.quiet && !matches!(params.format, OutputFormat::Json | OutputFormat::FilesOnly) {
+    if !params.quiet
+        && !matches!(
+            params.format,
+            OutputFormat::Json | OutputFormat::JsonLines | OutputFormat::FilesOnly
+        )
+    {
         let result_word = if results.len() == 1 {
             "result"
         } else {
@@ -195,7 +217,7 @@ fn run_similar_search(
         std::process::exit(EXIT_ERROR);
     }
 
-    if !quiet {
+    let status = (!quiet).then(|| {
         let ref_desc = match &file_ref {
             FileRef::ByName { path, name } => {
                 format!(
@@ -223,20 +245,18 @@ fn run_similar_search(
                 .to_string_lossy()
                 .into_owned(),
         };
-        eprint!("Finding similar to {ref_desc}...");
-    }
+        format!("Finding similar to {ref_desc}...")
+    });
 
     let abs_path = Path::new(file_path)
         .canonicalize()
         .unwrap_or_else(|_| file_path.into());
     let abs_str = abs_path.to_string_lossy();
 
-    let index = SemanticIndex::new(&index_root, None)?;
-    let mut results = index.find_similar(&abs_str, line, name, num_results)?;
-
-    if !quiet {
-        eprintln!("\r                                \r");
-    }
+    let (results, _) = timed_status(status.as_deref(), || {
+        SemanticIndex::new(&index_root, None)?.find_similar(&abs_str, line, name, num_results)
+    });
+    let mut results = results?;
 
     // Boost similar results using the reference name as query
     let boost_query = name.unwrap_or("");
@@ -245,15 +265,15 @@ fn run_similar_search(
     }
 
     if results.is_empty() {
-        if !matches!(format, OutputFormat::Json) {
+        if !matches!(format, OutputFormat::Json | OutputFormat::JsonLines) {
             eprintln!("No similar code found");
         }
         std::process::exit(EXIT_NO_MATCH);
     }
 
-    print_results(&results, format, true, Some(&index_root), context_lines);
+    print_results(&mut results, format, true, Some(&index_root), context_lines);
 
-    if !quiet && !matches!(format, OutputFormat::Json) {
+    if !quiet && !matches!(format, OutputFormat::Json | OutputFormat::JsonLines) {
         let result_word = if results.len() == 1 {
             "result"
         } else {
@@ -265,6 +285,49 @@ fn run_similar_search(
     Ok(())
 }
 
+/// Run `f` behind a transient stderr status line (cleared afterwards) and time it.
+/// `status` is None when quiet.
+fn timed_status<T>(status: Option<&str>, f: impl FnOnce() -> T) -> (T, Duration) {
+    if let Some(msg) = status {
+        eprint!("{msg}");
+    }
+    let t0 = Instant::now();
+    let out = f();
+    let elapsed = t0.elapsed();
+    if let Some(msg) = status {
+        eprintln!("\r{:width$}\r", "", width = msg.len());
+    }
+    (out, elapsed)
+}
+
+/// `OG_CHECK_INTERVAL=N`: skip the auto-update walk when the index was
+/// checked in the last N seconds. Unset or 0 checks on every search.
+fn check_interval() -> Option<Duration> {
+    std::env::var("OG_CHECK_INTERVAL")
+        .ok()?
+        .parse::<u64>()
+        .ok()
+        .filter(|&secs| secs > 0)
+        .map(Duration::from_secs)
+}
+
+/// Truncate at the first large score drop: the first gap between neighbours
+/// larger than `delta` times the top score. Expects results sorted by score.
+fn elbow_cut(results: &mut Vec<crate::types::SearchResult>, delta: f32) {
+    let Some(top) = results.first().map(|r| r.score) else {
+        return;
+    };
+    if top <= 0.0 {
+        return;
+    }
+    if let Some(i) = results
+        .windows(2)
+        .position(|w| w[0].score - w[1].score > delta * top)
+    {
+        results.truncate(i + 1);
+    }
+}
+
 /// Parse query as file reference: file#name, file:line, or existing file.
 fn parse_file_reference(query: &str) -> Option<FileRef> {
     if query.is_empty() {
@@ -313,78 +376,179 @@ fn parse_file_reference(query: &str) -> Option<FileRef> {
     None
 }
 
-/// Filter results by file type and exclude patterns.
-fn filter_results(
-    mut results: Vec<crate::types::SearchResult>,
-    file_types: Option<&str>,
-    exclude: &[String],
-    code_only: bool,
-) -> Vec<crate::types::SearchResult> {
-    // Build exclude list
-    let mut exclude_patterns: Vec<String> = exclude.to_vec();
-    if code_only {
-        exclude_patterns.extend(
-            ["*.md", "*.markdown", "*.txt", "*.rst", "*.adoc"]
-                .iter()
-                .map(|s| s.to_string()),
-        );
+/// Doc extensions dropped by --code-only.
+const DOC_PATTERNS: &[&str] = &["*.md", "*.markdown", "*.txt", "*.rst", "*.adoc"];
+
+/// Compile --exclude (plus --code-only doc patterns) into one glob set.
+///
+/// Patterns are gitignore-style and matched against paths relative to the
+/// search root: unanchored patterns match at any depth (`*.md`, `tests/*`),
+/// a leading `/` anchors to the root, and a pattern naming a directory
+/// also excludes everything under it. Returns None when nothing is excluded.
+fn compile_excludes(exclude: &[String], code_only: bool) -> Result<Option<GlobSet>> {
+    let doc_patterns = DOC_PATTERNS.iter().copied().filter(|_| code_only);
+    let patterns: Vec<&str> = exclude
+        .iter()
+        .map(String::as_str)
+        .chain(doc_patterns)
+        .collect();
+    if patterns.is_empty() {
+        return Ok(None);
     }
 
-    if file_types.is_none() && exclude_patterns.is_empty() {
-        return results;
+    let mut builder = GlobSetBuilder::new();
+    for pattern in patterns {
+        let pattern = pattern.trim_start_matches("./").trim_end_matches('/');
+        let base = match pattern.strip_prefix('/') {
+            Some(anchored) => anchored.to_string(),
+            None if pattern.starts_with("**/") => pattern.to_string(),
+            None => format!("**/{pattern}"),
+        };
+        for glob in [base.clone(), format!("{base}/**")] {
+            builder.add(
+                GlobBuilder::new(&glob)
+                    .literal_separator(true)
+                    .build()
+                    .with_context(|| format!("Invalid exclude pattern: {pattern}"))?,
+            );
+        }
     }
 
-    // File type filtering
-    if let Some(types) = file_types {
-        let type_map: &[(&str, &[&str])] = &[
-            ("py", &[".py", ".pyi"]),
-            ("js", &[".js", ".jsx", ".mjs"]),
-            ("ts", &[".ts", ".tsx"]),
-            ("rust", &[".rs"]),
-            ("rs", &[".rs"]),
-            ("go", &[".go"]),
-            ("java", &[".java"]),
-            ("c", &[".c", ".h"]),
-            ("cpp", &[".cpp", ".cc", ".cxx", ".hpp", ".hh"]),
-            ("cs", &[".cs"]),
-            ("rb", &[".rb"]),
-            ("php", &[".php"]),
-            ("sh", &[".sh", ".bash", ".zsh"]),
-            ("md", &[".md", ".markdown"]),
-            ("json", &[".json"]),
-            ("yaml", &[".yaml", ".yml"]),
-            ("toml", &[".toml"]),
-        ];
+    Ok(Some(builder.build()?))
+}
 
-        let mut allowed_exts: std::collections::HashSet<String> = std::collections::HashSet::new();
-        for ft in types.split(',') {
-            let ft = ft.trim().to_lowercase();
-            let found = type_map.iter().find(|(name, _)| *name == ft);
-            if let Some((_, exts)) = found {
-                for ext in *exts {
-                    allowed_exts.insert(ext.to_string());
-                }
-            } else {
-                allowed_exts.insert(format!(".{ft}"));
+/// `--type` names and the extensions (lowercase, no leading dot) each selects.
+/// Names not listed here are taken as a bare extension.
+const TYPE_MAP: &[(&str, &[&str])] = &[
+    ("py", &["py", "pyi"]),
+    ("js", &["js", "jsx", "mjs"]),
+    ("ts", &["ts", "tsx"]),
+    ("rust", &["rs"]),
+    ("rs", &["rs"]),
+    ("go", &["go"]),
+    ("java", &["java"]),
+    ("c", &["c", "h"]),
+    ("cpp", &["cpp", "cc", "cxx", "hpp", "hh"]),
+    ("cs", &["cs"]),
+    ("rb", &["rb"]),
+    ("php", &["php"]),
+    ("sh", &["sh", "bash", "zsh"]),
+    ("md", &["md", "markdown"]),
+    ("json", &["json"]),
+    ("yaml", &["yaml", "yml"]),
+    ("toml", &["toml"]),
+];
+
+/// Resolve a comma-separated `--type` list into the set of allowed extensions.
+fn allowed_extensions(types: &str) -> HashSet<String> {
+    let mut allowed = HashSet::new();
+    for ft in types.split(',') {
+        let ft = ft.trim().to_lowercase();
+        match TYPE_MAP.iter().find(|(name, _)| *name == ft) {
+            Some((_, exts)) => allowed.extend(exts.iter().map(|ext| ext.to_string())),
+            None => {
+                allowed.insert(ft);
             }
         }
+    }
+    allowed
+}
 
-        results.retain(|r| allowed_exts.iter().any(|ext| r.file.ends_with(ext)));
+/// Filter results by file type and compiled exclude patterns.
+fn filter_results(
+    mut results: Vec<crate::types::SearchResult>,
+    file_types: Option<&str>,
+    excludes: Option<&GlobSet>,
+    root: &Path,
+) -> Vec<crate::types::SearchResult> {
+    if file_types.is_none() && excludes.is_none() {
+        return results;
     }
 
-    // Exclude pattern filtering (simple glob matching)
-    if !exclude_patterns.is_empty() {
-        results.retain(|r| {
-            !exclude_patterns.iter().any(|pattern| {
-                // Simple glob: *.ext matching
-                if let Some(ext) = pattern.strip_prefix('*') {
-                    r.file.ends_with(ext)
+    let allowed_exts = file_types.map(allowed_extensions);
+
+    // One pass: extension set lookup, then (only for survivors) one glob-set match.
+    // Already-lowercase extensions (nearly all) are looked up as-is.
+    results.retain(|r| {
+        let file = Path::new(&r.file);
+        let type_ok = allowed_exts.as_ref().is_none_or(|allowed| {
+            file.extension().and_then(|e| e.to_str()).is_some_and(|e| {
+                if e.chars().any(char::is_uppercase) {
+                    allowed.contains(&e.to_lowercase())
                 } else {
-                    r.file.contains(pattern)
+                    allowed.contains(e)
                 }
             })
         });
-    }
+        type_ok
+            && excludes
+                .is_none_or(|excludes| !excludes.is_match(file.strip_prefix(root).unwrap_or(file)))
+    });
 
     results
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::types::SearchResult;
+
+    fn files(results: &[SearchResult]) -> Vec<&str> {
+        results.iter().map(|r| r.file.as_str()).collect()
+    }
+
+    #[test]
+    fn type_filter_matches_extension() {
+        let results = vec![
+            SearchResult::in_file("/repo/a.py"),
+            SearchResult::in_file("/repo/b.PYI"),
+            SearchResult::in_file("/repo/c.rs"),
+            SearchResult::in_file("/repo/py"),
+        ];
+        let filtered = filter_results(results, Some("py"), None, Path::new("/repo"));
+        assert_eq!(files(&filtered), ["/repo/a.py", "/repo/b.PYI"]);
+    }
+
+    #[test]
+    fn type_names_resolve_to_extensions() {
+        let allowed = allowed_extensions("py, Vue");
+        let mut exts: Vec<&str> = allowed.iter().map(String::as_str).collect();
+        exts.sort_unstable();
+        assert_eq!(exts, ["py", "pyi", "vue"]);
+    }
+
+    #[test]
+    fn excludes_match_relative_to_root() {
+        let results = vec![
+            SearchResult::in_file("/tests/repo/src/lib.rs"),
+            SearchResult::in_file("/tests/repo/tests/cli.rs"),
+            SearchResult::in_file("/tests/repo/README.md"),
+            SearchResult::in_file("/tests/repo/src/generated/out.rs"),
+        ];
+        let exclude = ["tests/*".to_string(), "generated".to_string()];
+        let excludes = compile_excludes(&exclude, true).unwrap();
+        let filtered = filter_results(results, None, excludes.as_ref(), Path::new("/tests/repo"));
+        assert_eq!(files(&filtered), ["/tests/repo/src/lib.rs"]);
+    }
+
+    #[test]
+    fn elbow_cuts_at_first_large_gap() {
+        let mut results: Vec<SearchResult> = [10.0, 9.5, 9.0, 6.0, 5.8, 2.0]
+            .into_iter()
+            .map(|score| SearchResult {
+                score,
+                ..SearchResult::in_file("/repo/a.rs")
+            })
+            .collect();
+        elbow_cut(&mut results, 0.15);
+        assert_eq!(results.len(), 3);
+
+        elbow_cut(&mut results, 0.15);
+        assert_eq!(results.len(), 3);
+    }
+
+    #[test]
+    fn no_excludes_compiles_to_none() {
+        assert!(compile_excludes(&[], false).unwrap().is_none());
+    }
+}
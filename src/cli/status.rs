@@ -27,12 +27,13 @@ pub fn run(path: &Path) -> Result<()> {
     };
 
     let block_count = index.count()?;
-    let files = walker::scan(&path)?;
-    let file_count = files.len();
+    // Stat everything, but read and hash only files whose mtime moved
+    let metadata = walker::scan_metadata(&path)?;
 
-    let stale_result = index.get_stale_files(&files);
+    let stale_result = index.get_stale_files_checked(&metadata);
     match stale_result {
-        Ok((changed, deleted)) => {
+        Ok((changed, deleted, skipped)) => {
+            let file_count = metadata.len() - skipped;
             let stale_count = changed.len() + deleted.len();
             if stale_count == 0 {
                 println!("{file_count} files, {block_count} blocks (up to date)");
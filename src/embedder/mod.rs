@@ -1,6 +1,9 @@
 pub mod onnx;
 pub mod tokenizer;
 
+use std::path::PathBuf;
+use std::sync::OnceLock;
+
 use anyhow::{Context, Result};
 use ndarray::Array2;
 
@@ -52,7 +55,13 @@ pub trait Embedder: Send + Sync {
 
 /// Create the embedder, downloading model files if needed.
 pub fn create_embedder() -> Result<Box<dyn Embedder>> {
-    let (model_path, tokenizer_path) = download_model_files(MODEL)?;
+    let (model_path, tokenizer_path) = match cached_model_files(MODEL) {
+        Some((model, tokenizer)) => (
+            model.to_string_lossy().into_owned(),
+            tokenizer.to_string_lossy().into_owned(),
+        ),
+        None => download_model_files(MODEL)?,
+    };
     Ok(Box::new(onnx::OnnxEmbedder::new(
         &model_path,
         &tokenizer_path,
@@ -60,19 +69,53 @@ pub fn create_embedder() -> Result<Box<dyn Embedder>> {
     )?))
 }
 
+/// Process-wide embedder, created on first call. Long-running callers (the MCP
+/// server) open a SemanticIndex per request; sharing one embedder keeps them
+/// from rebuilding the ONNX session every time.
+pub fn shared_embedder() -> Result<&'static dyn Embedder> {
+    static EMBEDDER: OnceLock<Box<dyn Embedder>> = OnceLock::new();
+    if let Some(embedder) = EMBEDDER.get() {
+        return Ok(embedder.as_ref());
+    }
+    let embedder = create_embedder()?;
+    Ok(EMBEDDER.get_or_init(|| embedder).as_ref())
+}
+
+/// Local paths of the model and tokenizer if both are already in the HF cache.
+/// Filesystem lookups only: no API client (and its TLS setup) is constructed.
+pub fn cached_model_files(config: &ModelConfig) -> Option<(PathBuf, PathBuf)> {
+    let repo = hf_hub::Cache::default().model(config.repo.to_string());
+    Some((
+        repo.get(config.model_file)?,
+        repo.get(config.tokenizer_file)?,
+    ))
+}
+
 /// Download both model and tokenizer files, returning their local paths.
+/// The two fetches run concurrently (two independent round-trips on a cold cache).
 fn download_model_files(config: &ModelConfig) -> Result<(String, String)> {
     let api = hf_hub::api::sync::Api::new().context("Failed to create HF Hub API")?;
     let repo = api.model(config.repo.to_string());
 
-    let model_path = repo.get(config.model_file).with_context(|| {
+    let (model_path, tokenizer_path) = std::thread::scope(|s| {
+        let tokenizer = s.spawn(|| repo.get(config.tokenizer_file));
+        let model = repo.get(config.model_file);
+        (
+            model,
+            tokenizer
+                .join()
+                .expect("tokenizer download thread panicked"),
+        )
+    });
+
+    let model_path = model_path.with_context(|| {
         format!(
             "Failed to download model from {}. Run 'og model install' while online.",
             config.repo
         )
     })?;
 
-    let tokenizer_path = repo.get(config.tokenizer_file).with_context(|| {
+    let tokenizer_path = tokenizer_path.with_context(|| {
         format!(
             "Failed to download tokenizer from {}. Run 'og model install' while online.",
             config.repo
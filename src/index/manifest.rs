@@ -42,12 +42,20 @@ impl Manifest {
             return Ok(Self::default());
         }
 
-        let content = std::fs::read_to_string(&manifest_path)?;
-        if content.trim().is_empty() {
+        let content = std::fs::read(&manifest_path)?;
+        if content.iter().all(u8::is_ascii_whitespace) {
             return Ok(Self::default());
         }
 
-        let data: serde_json::Value = serde_json::from_str(&content)?;
+        // Fast path: a current manifest deserializes straight into the struct,
+        // without building a serde_json::Value tree first
+        if let Ok(manifest) = serde_json::from_slice::<Manifest>(&content) {
+            if manifest.version == MANIFEST_VERSION {
+                return Ok(manifest);
+            }
+        }
+
+        let data: serde_json::Value = serde_json::from_slice(&content)?;
 
         let version = data.get("version").and_then(|v| v.as_u64()).unwrap_or(1) as u32;
 
@@ -77,9 +85,49 @@ impl Manifest {
         std::fs::create_dir_all(index_dir)?;
         let manifest_path = index_dir.join(MANIFEST_FILE);
         let tmp_path = index_dir.join(".manifest.json.tmp");
-        let content = serde_json::to_string_pretty(self)?;
+        // Compact: the manifest is machine-read, and whitespace is a large share of it
+        let content = serde_json::to_vec(self)?;
         std::fs::write(&tmp_path, &content)?;
         std::fs::rename(&tmp_path, &manifest_path)?;
         Ok(())
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn entry() -> FileEntry {
+        FileEntry {
+            hash: "abc".to_string(),
+            blocks: vec!["src/lib.rs:1:f".to_string()],
+            mtime: 42,
+        }
+    }
+
+    #[test]
+    fn roundtrip() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let mut manifest = Manifest::default();
+        manifest.files.insert("src/lib.rs".to_string(), entry());
+        manifest.save(tmp.path()).unwrap();
+
+        let loaded = Manifest::load(tmp.path()).unwrap();
+        assert_eq!(loaded.version, MANIFEST_VERSION);
+        assert_eq!(loaded.files["src/lib.rs"].mtime, 42);
+    }
+
+    #[test]
+    fn older_version_with_files_needs_rebuild() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let mut manifest = Manifest {
+            version: MANIFEST_VERSION - 1,
+            ..Manifest::default()
+        };
+        manifest.files.insert("src/lib.rs".to_string(), entry());
+        manifest.save(tmp.path()).unwrap();
+
+        let err = Manifest::load(tmp.path()).unwrap_err();
+        assert!(err.to_string().contains("older version"));
+    }
+}
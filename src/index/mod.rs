@@ -1,11 +1,15 @@
 pub mod manifest;
+pub mod query_cache;
+pub mod result_cache;
 pub mod walker;
 
 use std::collections::hash_map::Entry;
 use std::collections::HashMap;
 use std::path::{Path, PathBuf};
+use std::time::{Duration, SystemTime};
 
 use anyhow::{bail, Context, Result};
+use ndarray::Array2;
 use rayon::prelude::*;
 
 use crate::embedder::{self, Embedder};
@@ -15,6 +19,8 @@ use crate::types::{Block, IndexStats, SearchResult};
 use omendb::SearchOptions;
 
 use manifest::{FileEntry, Manifest};
+use query_cache::QueryCache;
+use result_cache::ResultCache;
 
 pub const INDEX_DIR: &str = ".og";
 pub const VECTORS_DIR: &str = "vectors";
@@ -22,16 +28,22 @@ pub const VECTORS_DIR: &str = "vectors";
 /// Block types that are documentation, not code.
 const DOC_BLOCK_TYPES: &[&str] = &["text", "section"];
 
+/// Stamp touched after each search-time staleness check.
+const LAST_CHECK_FILE: &str = "last_check";
+
 /// When search scope filters results, over-fetch by this factor to compensate.
 const SCOPE_OVERFETCH: usize = 5;
 
+/// A file ready for indexing: (path, content, rel_path, content hash, mtime).
+type HashedFile<'a> = (&'a Path, &'a str, String, String, u64);
+
 /// Manages semantic search index using omendb.
 pub struct SemanticIndex {
     root: PathBuf,
     index_dir: PathBuf,
     vectors_path: String,
     search_scope: Option<String>,
-    embedder: Box<dyn Embedder>,
+    cache_results: bool,
 }
 
 impl SemanticIndex {
@@ -40,22 +52,32 @@ impl SemanticIndex {
         let index_dir = root.join(INDEX_DIR);
         let vectors_path = index_dir.join(VECTORS_DIR).to_string_lossy().into_owned();
         let scope = Self::compute_scope(&root, search_scope);
-        let embedder = embedder::create_embedder()?;
 
         Ok(Self {
             root,
             index_dir,
             vectors_path,
             search_scope: scope,
-            embedder,
+            cache_results: false,
         })
     }
 
+    /// Get the embedder. The model is loaded on first use only: status, clean,
+    /// similar search, and cache hits never need it.
+    fn embedder(&self) -> Result<&'static dyn Embedder> {
+        embedder::shared_embedder()
+    }
+
     /// Set search scope after construction (for reusing a single instance).
     pub fn set_search_scope(&mut self, search_scope: Option<&Path>) {
         self.search_scope = Self::compute_scope(&self.root, search_scope);
     }
 
+    /// Reuse results of an identical earlier search against the same index state.
+    pub fn set_cache_results(&mut self, enabled: bool) {
+        self.cache_results = enabled;
+    }
+
     fn compute_scope(root: &Path, search_scope: Option<&Path>) -> Option<String> {
         search_scope.and_then(|s| {
             let s = s.canonicalize().unwrap_or_else(|_| s.to_path_buf());
@@ -71,7 +93,6 @@ impl SemanticIndex {
 
     /// Build index from scanned files. Each entry is (content, mtime) where
     /// mtime was captured before reading content to avoid race conditions.
-    #[allow(clippy::type_complexity)]
     pub fn index(
         &self,
         files: &HashMap<PathBuf, (String, u64)>,
@@ -79,19 +100,44 @@ impl SemanticIndex {
     ) -> Result<IndexStats> {
         std::fs::create_dir_all(&self.index_dir)?;
         let mut manifest = Manifest::load(&self.index_dir)?;
+        let mut store = self.open_or_create_store()?;
+
+        let hashed = self.hash_files(files);
+        self.index_into(&mut manifest, &mut store, hashed, on_progress)
+    }
+
+    /// Hash scanned files in parallel, borrowing their content.
+    fn hash_files<'a>(&self, files: &'a HashMap<PathBuf, (String, u64)>) -> Vec<HashedFile<'a>> {
+        files
+            .par_iter()
+            .map(|(path, (content, mtime))| {
+                (
+                    path.as_path(),
+                    content.as_str(),
+                    self.to_relative(path),
+                    hash_content(content),
+                    *mtime,
+                )
+            })
+            .collect()
+    }
+
+    /// Index already-hashed files into a loaded manifest and open store,
+    /// saving the manifest when blocks were written.
+    fn index_into(
+        &self,
+        manifest: &mut Manifest,
+        store: &mut omendb::VectorStore,
+        files: Vec<HashedFile>,
+        on_progress: Option<&dyn Fn(usize, usize, &str)>,
+    ) -> Result<IndexStats> {
         manifest.model = embedder::MODEL.version.to_string();
         let mut stats = IndexStats::default();
-
-        // Open omendb multi-vector store
-        let mut store = self.open_or_create_store()?;
         store.enable_text_search()?;
 
-        // Identify files needing processing (borrow content, don't clone)
-        let mut to_process: Vec<(&Path, &str, String, String, u64)> = Vec::new();
-        for (path, (content, mtime)) in files {
-            let rel_path = self.to_relative(path);
-            let file_hash = hash_content(content);
-
+        // Identify files needing processing
+        let mut to_process: Vec<HashedFile> = Vec::new();
+        for (path, content, rel_path, file_hash, mtime) in files {
             if let Some(entry) = manifest.files.get(&rel_path) {
                 if entry.hash == file_hash {
                     stats.skipped += 1;
@@ -104,13 +150,7 @@ impl SemanticIndex {
                 stats.deleted += entry.blocks.len();
             }
 
-            to_process.push((
-                path.as_path(),
-                content.as_str(),
-                rel_path,
-                file_hash,
-                *mtime,
-            ));
+            to_process.push((path, content, rel_path, file_hash, mtime));
         }
 
         if to_process.is_empty() {
@@ -160,7 +200,7 @@ impl SemanticIndex {
         }
 
         if prepared.is_empty() {
-            manifest.save(&self.index_dir)?;
+            self.save_manifest(manifest)?;
             return Ok(stats);
         }
 
@@ -170,49 +210,69 @@ impl SemanticIndex {
         let total = prepared.len();
         let batch_size = embedder::MODEL.batch_size;
 
-        // Embed in batches
-        for start in (0..total).step_by(batch_size) {
-            let end = (start + batch_size).min(total);
-            if let Some(progress) = on_progress {
-                progress(
-                    start,
-                    total,
-                    &format!("Embedding {}-{} of {total}", start, end),
-                );
-            }
-
-            let batch_refs: Vec<&str> = prepared[start..end]
-                .iter()
-                .map(|p| p.text.as_str())
-                .collect();
-            let token_embeddings = self.embedder.embed_documents(&batch_refs)?;
-
-            for (idx, token_emb) in token_embeddings.embeddings.iter().enumerate() {
-                let p = &prepared[start + idx];
-                let block = &all_blocks[p.file_idx].0[p.block_idx];
-
-                let tokens: Vec<Vec<f32>> = token_emb
-                    .rows()
-                    .into_iter()
-                    .take(embedder::MAX_STORED_TOKENS)
-                    .map(|r| r.to_vec())
-                    .collect();
-
-                let metadata = serde_json::json!({
-                    "file": block.file,
-                    "type": block.block_type,
-                    "name": block.name,
-                    "start_line": block.start_line,
-                    "end_line": block.end_line,
-                    "content": block.content,
-                });
+        let embedder = self.embedder()?;
+
+        // Embed on a worker thread while this one stores the previous batch, so
+        // ONNX inference overlaps store_with_text (MuVERA encoding + BM25). The
+        // channel holds one batch: at most three are alive at once.
+        std::thread::scope(|s| -> Result<()> {
+            let (tx, rx) = std::sync::mpsc::sync_channel(1);
+            let prepared = &prepared;
+            s.spawn(move || {
+                for start in (0..total).step_by(batch_size) {
+                    let end = (start + batch_size).min(total);
+                    let batch_refs: Vec<&str> = prepared[start..end]
+                        .iter()
+                        .map(|p| p.text.as_str())
+                        .collect();
+                    let embedded = embedder.embed_documents(&batch_refs);
+                    let failed = embedded.is_err();
+                    // A closed channel means the store side bailed out
+                    if tx.send((start, embedded)).is_err() || failed {
+                        break;
+                    }
+                }
+            });
 
-                let bm25_text = split_identifiers(&p.text);
-                store.store_with_text(&block.id, tokens, &bm25_text, metadata)?;
+            for (start, embedded) in rx {
+                let token_embeddings = embedded?;
+                if let Some(progress) = on_progress {
+                    let end = start + token_embeddings.embeddings.len();
+                    progress(
+                        start,
+                        total,
+                        &format!("Embedding {}-{} of {total}", start, end),
+                    );
+                }
 
-                stats.blocks += 1;
+                for (idx, token_emb) in token_embeddings.embeddings.iter().enumerate() {
+                    let p = &prepared[start + idx];
+                    let block = &all_blocks[p.file_idx].0[p.block_idx];
+
+                    let tokens: Vec<Vec<f32>> = token_emb
+                        .rows()
+                        .into_iter()
+                        .take(embedder::MAX_STORED_TOKENS)
+                        .map(|r| r.to_vec())
+                        .collect();
+
+                    let metadata = serde_json::json!({
+                        "file": block.file,
+                        "type": block.block_type,
+                        "name": block.name,
+                        "start_line": block.start_line,
+                        "end_line": block.end_line,
+                        "content": block.content,
+                    });
+
+                    let bm25_text = split_identifiers(&p.text);
+                    store.store_with_text(&block.id, tokens, &bm25_text, metadata)?;
+
+                    stats.blocks += 1;
+                }
             }
-        }
+            Ok(())
+        })?;
 
         store.flush()?;
 
@@ -230,7 +290,7 @@ impl SemanticIndex {
             }
         }
 
-        manifest.save(&self.index_dir)?;
+        self.save_manifest(manifest)?;
 
         if let Some(progress) = on_progress {
             progress(total, total, "Done");
@@ -240,10 +300,62 @@ impl SemanticIndex {
     }
 
     /// Hybrid search: semantic + BM25 with merged candidates.
+    /// With result caching on, a repeat of an earlier search (same query text,
+    /// scope, and k) against the same index state skips embedding and search.
     pub fn search(&self, query: &str, k: usize) -> Result<Vec<SearchResult>> {
+        let bm25_query = bm25_query(query);
+        if !self.cache_results {
+            let query_tokens = self.embed_query_cached(query)?;
+            let hits = self.search_hits(&bm25_query, &query_tokens, k)?;
+            return Ok(self.to_results(&hits));
+        }
+
+        let mut cache = ResultCache::load(&self.index_dir);
+        if let Some(cached) = cache.lookup(&bm25_query, self.search_scope.as_deref(), k) {
+            // The cache is dropped on every index write, so its ids are live
+            let store = self.open_store()?;
+            let mut results: Vec<SearchResult> = cached
+                .iter()
+                .filter_map(|(id, score)| {
+                    let meta = store.get_metadata_by_id(id)?;
+                    Some(result_from_metadata(&meta, *score))
+                })
+                .collect();
+            self.absolutize(&mut results);
+            return Ok(results);
+        }
+
+        let query_tokens = self.embed_query_cached(query)?;
+        let hits = self.search_hits(&bm25_query, &query_tokens, k)?;
+        let cached = hits.iter().map(|r| (r.id.clone(), r.distance)).collect();
+        cache.insert(bm25_query, self.search_scope.clone(), k, cached);
+        let _ = cache.save();
+
+        Ok(self.to_results(&hits))
+    }
+
+    /// Embed a query, reusing the on-disk embedding if this exact query was seen before.
+    fn embed_query_cached(&self, query: &str) -> Result<Array2<f32>> {
+        let cache = QueryCache::new(&self.index_dir);
+        if let Some(tokens) = cache.get(query) {
+            return Ok(tokens);
+        }
+
+        let tokens = self.embedder()?.embed_query(query)?;
+        cache.put(query, &tokens);
+        Ok(tokens)
+    }
+
+    /// Hybrid search returning the top-k in-scope store hits, best first.
+    /// Only these are ever converted to results, not every merged candidate.
+    fn search_hits(
+        &self,
+        bm25_query: &str,
+        query_tokens: &Array2<f32>,
+        k: usize,
+    ) -> Result<Vec<omendb::SearchResult>> {
         let store = self.open_store()?;
 
-        let query_tokens = self.embedder.embed_query(query)?;
         let tokens: Vec<Vec<f32>> = (0..query_tokens.nrows())
             .map(|r| query_tokens.row(r).to_vec())
             .collect();
@@ -258,9 +370,7 @@ impl SemanticIndex {
         let search_k = k.saturating_mul(overfetch);
 
         // Run both BM25+MaxSim and pure semantic search, merge by ID
-        let bm25_query = crate::synonyms::expand_query(&split_identifiers(query));
-        let bm25_results =
-            store.search_multi_with_text(&bm25_query, &token_refs, search_k, None)?;
+        let bm25_results = store.search_multi_with_text(bm25_query, &token_refs, search_k, None)?;
         let semantic_results =
             store.query_with_options(&token_refs, search_k, &SearchOptions::default())?;
 
@@ -285,32 +395,25 @@ impl SemanticIndex {
         merge(bm25_results);
         merge(semantic_results);
 
-        let mut output = Vec::new();
-        for r in best.into_values() {
-            if let Some(scope) = &self.search_scope {
-                let file = r
-                    .metadata
-                    .get("file")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("");
-                let scope = scope.as_str();
-                if file != scope && !file.starts_with(&format!("{scope}/")) {
-                    continue;
-                }
-            }
-
-            output.push(self.result_from_omendb(&r));
-        }
+        let mut output: Vec<omendb::SearchResult> =
+            best.into_values().filter(|r| self.in_scope(r)).collect();
 
         output.sort_by(|a, b| {
-            b.score
-                .partial_cmp(&a.score)
+            b.distance
+                .partial_cmp(&a.distance)
                 .unwrap_or(std::cmp::Ordering::Equal)
         });
         output.truncate(k);
         Ok(output)
     }
 
+    /// Convert store hits to results with absolute file paths.
+    fn to_results(&self, hits: &[omendb::SearchResult]) -> Vec<SearchResult> {
+        let mut results: Vec<SearchResult> = hits.iter().map(result_from_omendb).collect();
+        self.absolutize(&mut results);
+        results
+    }
+
     /// Find blocks similar to a given file/block.
     pub fn find_similar(
         &self,
@@ -370,25 +473,18 @@ impl SemanticIndex {
                 continue;
             }
 
-            if let Some(scope) = &self.search_scope {
-                let file = r
-                    .metadata
-                    .get("file")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("");
-                let scope = scope.as_str();
-                if file != scope && !file.starts_with(&format!("{scope}/")) {
-                    continue;
-                }
+            if !self.in_scope(&r) {
+                continue;
             }
 
-            output.push(self.result_from_omendb(&r));
+            output.push(result_from_omendb(&r));
 
             if output.len() >= k {
                 break;
             }
         }
 
+        self.absolutize(&mut output);
         Ok(output)
     }
 
@@ -403,23 +499,23 @@ impl SemanticIndex {
         Ok(manifest.files.values().map(|e| e.blocks.len()).sum())
     }
 
-    /// Get stale files by comparing content hashes against manifest.
-    fn get_stale_files_with_manifest(
+    /// Compare file metadata against manifest mtimes.
+    /// Returns (maybe_changed paths, deleted rel_paths).
+    fn mtime_diff(
         &self,
-        files: &HashMap<PathBuf, (String, u64)>,
+        metadata: &HashMap<PathBuf, walker::FileMetadata>,
         manifest: &Manifest,
     ) -> (Vec<PathBuf>, Vec<String>) {
-        let mut changed = Vec::new();
+        let mut maybe_changed = Vec::new();
         let mut current_rel_files = std::collections::HashSet::new();
 
-        for (path, (content, _mtime)) in files {
+        for (path, &(_size, mtime)) in metadata {
             let rel_path = self.to_relative(path);
             current_rel_files.insert(rel_path.clone());
-            let file_hash = hash_content(content);
 
             match manifest.files.get(&rel_path) {
-                Some(entry) if entry.hash == file_hash => {}
-                _ => changed.push(path.clone()),
+                Some(entry) if entry.mtime == mtime && mtime > 0 => {}
+                _ => maybe_changed.push(path.clone()),
             }
         }
 
@@ -430,29 +526,17 @@ impl SemanticIndex {
             .cloned()
             .collect();
 
-        (changed, deleted)
+        (maybe_changed, deleted)
     }
 
-    /// Compare file metadata against manifest mtimes.
-    /// Returns (maybe_changed paths, deleted rel_paths).
-    fn mtime_diff(
+    /// Every scanned file as a candidate, plus rel_paths no longer on disk.
+    fn all_with_deleted(
         &self,
         metadata: &HashMap<PathBuf, walker::FileMetadata>,
         manifest: &Manifest,
     ) -> (Vec<PathBuf>, Vec<String>) {
-        let mut maybe_changed = Vec::new();
-        let mut current_rel_files = std::collections::HashSet::new();
-
-        for (path, &(_size, mtime)) in metadata {
-            let rel_path = self.to_relative(path);
-            current_rel_files.insert(rel_path.clone());
-
-            match manifest.files.get(&rel_path) {
-                Some(entry) if entry.mtime == mtime && mtime > 0 => {}
-                _ => maybe_changed.push(path.clone()),
-            }
-        }
-
+        let current_rel_files: std::collections::HashSet<String> =
+            metadata.keys().map(|path| self.to_relative(path)).collect();
         let deleted: Vec<String> = manifest
             .files
             .keys()
@@ -460,7 +544,7 @@ impl SemanticIndex {
             .cloned()
             .collect();
 
-        (maybe_changed, deleted)
+        (metadata.keys().cloned().collect(), deleted)
     }
 
     /// Fast staleness check using mtime only (no content reads).
@@ -477,9 +561,31 @@ impl SemanticIndex {
     pub fn check_and_update(
         &self,
         metadata: &HashMap<PathBuf, walker::FileMetadata>,
+    ) -> Result<(usize, Option<IndexStats>)> {
+        self.refresh(metadata, true)
+    }
+
+    /// Like `check_and_update`, but reads and hashes every file instead of
+    /// trusting a matching (whole-second) mtime, so edits that kept their mtime
+    /// (same-second writes, `cp -p`, `rsync -t`) are caught. Explicit `og build`.
+    pub fn verify_and_update(
+        &self,
+        metadata: &HashMap<PathBuf, walker::FileMetadata>,
+    ) -> Result<(usize, Option<IndexStats>)> {
+        self.refresh(metadata, false)
+    }
+
+    fn refresh(
+        &self,
+        metadata: &HashMap<PathBuf, walker::FileMetadata>,
+        trust_mtime: bool,
     ) -> Result<(usize, Option<IndexStats>)> {
         let mut manifest = Manifest::load(&self.index_dir)?;
-        let (maybe_changed, deleted) = self.mtime_diff(metadata, &manifest);
+        let (maybe_changed, deleted) = if trust_mtime {
+            self.mtime_diff(metadata, &manifest)
+        } else {
+            self.all_with_deleted(metadata, &manifest)
+        };
 
         let stale_count = maybe_changed.len() + deleted.len();
         if stale_count == 0 {
@@ -487,121 +593,141 @@ impl SemanticIndex {
         }
 
         // Read content only for potentially changed files, then hash-check.
-        // Use mtime from scan_metadata (already captured via stat).
-        let mut changed_files: HashMap<PathBuf, (String, u64)> = HashMap::new();
-        for path in &maybe_changed {
-            let mtime = metadata.get(path).map(|&(_size, mt)| mt).unwrap_or(0);
-            let raw = match std::fs::read(path) {
-                Ok(data) => data,
-                Err(_) => continue,
-            };
-            let check_len = raw.len().min(8192);
-            if raw[..check_len].contains(&0) {
-                continue;
-            }
-            let content = match String::from_utf8(raw) {
-                Ok(s) => s,
-                Err(_) => continue,
-            };
-            let rel_path = self.to_relative(path);
-            let file_hash = hash_content(&content);
-            match manifest.files.get(&rel_path) {
-                Some(entry) if entry.hash == file_hash => {}
-                _ => {
-                    changed_files.insert(path.clone(), (content, mtime));
+        // The hash computed here is the one indexed: each file is hashed once.
+        let checked = self.hash_check(&maybe_changed, metadata, &manifest);
+
+        let mut changed_files: Vec<HashedFile> = Vec::new();
+        let mut touched = 0;
+        for (path, rel_path, mtime, fresh) in &checked {
+            match fresh {
+                Some((content, hash)) => {
+                    changed_files.push((
+                        *path,
+                        content.as_str(),
+                        rel_path.clone(),
+                        hash.clone(),
+                        *mtime,
+                    ));
+                }
+                None => {
+                    if let Some(entry) = manifest.files.get_mut(rel_path) {
+                        if entry.mtime != *mtime {
+                            entry.mtime = *mtime;
+                            touched += 1;
+                        }
+                    }
                 }
             }
         }
 
+        // Record new mtimes for touched-but-identical files so later checks skip
+        // the read. Results are unaffected, so the result cache stays valid.
+        if touched > 0 {
+            manifest.save(&self.index_dir)?;
+        }
+
         if changed_files.is_empty() && deleted.is_empty() {
             return Ok((0, None));
         }
 
         let actual_stale = changed_files.len() + deleted.len();
 
-        // Delete vectors for deleted files (reuse already-loaded manifest)
-        let mut deleted_count = 0;
-        {
-            let mut store = self.open_store()?;
+        // One store open and the already-loaded manifest serve both the
+        // deletions and the re-index
+        let mut store = self.open_store()?;
 
-            for rel_path in &deleted {
-                if let Some(entry) = manifest.files.remove(rel_path) {
-                    for block_id in &entry.blocks {
-                        let _ = store.delete(block_id);
-                    }
-                    deleted_count += entry.blocks.len();
+        let mut deleted_count = 0;
+        for rel_path in &deleted {
+            if let Some(entry) = manifest.files.remove(rel_path) {
+                for block_id in &entry.blocks {
+                    let _ = store.delete(block_id);
                 }
+                deleted_count += entry.blocks.len();
             }
+        }
 
-            if deleted_count > 0 {
-                store.flush()?;
-                manifest.save(&self.index_dir)?;
-            }
+        if deleted_count > 0 {
+            store.flush()?;
+            self.save_manifest(&manifest)?;
         }
 
-        let mut stats = self.index(&changed_files, None)?;
+        let mut stats = self.index_into(&mut manifest, &mut store, changed_files, None)?;
         stats.deleted += deleted_count;
         Ok((actual_stale, Some(stats)))
     }
 
-    /// Get stale files (changed + deleted). Loads manifest internally.
-    pub fn get_stale_files(
-        &self,
-        files: &HashMap<PathBuf, (String, u64)>,
-    ) -> Result<(Vec<PathBuf>, Vec<String>)> {
-        let manifest = Manifest::load(&self.index_dir)?;
-        Ok(self.get_stale_files_with_manifest(files, &manifest))
+    /// Whether a staleness check completed within `window`, per the stamp
+    /// written by `mark_checked`.
+    pub fn checked_within(&self, window: Duration) -> bool {
+        std::fs::metadata(self.index_dir.join(LAST_CHECK_FILE))
+            .and_then(|m| m.modified())
+            .ok()
+            .and_then(|t| t.elapsed().ok())
+            .is_some_and(|age| age < window)
     }
 
-    /// Quick check: how many files need updating?
-    pub fn needs_update(&self, files: &HashMap<PathBuf, (String, u64)>) -> Result<usize> {
-        let manifest = Manifest::load(&self.index_dir)?;
-        let (changed, deleted) = self.get_stale_files_with_manifest(files, &manifest);
-        Ok(changed.len() + deleted.len())
+    /// Record that the index was just checked against the tree. Best effort:
+    /// a missing stamp only means the next search checks again.
+    pub fn mark_checked(&self) {
+        let _ = std::fs::File::options()
+            .create(true)
+            .truncate(false)
+            .write(true)
+            .open(self.index_dir.join(LAST_CHECK_FILE))
+            .and_then(|f| f.set_modified(SystemTime::now()));
     }
 
-    /// Incremental update.
-    pub fn update(&self, files: &HashMap<PathBuf, (String, u64)>) -> Result<IndexStats> {
-        let mut manifest = Manifest::load(&self.index_dir)?;
-        let (changed, deleted) = self.get_stale_files_with_manifest(files, &manifest);
-
-        if changed.is_empty() && deleted.is_empty() {
-            return Ok(IndexStats {
-                skipped: files.len(),
-                ..Default::default()
-            });
-        }
-
-        // Delete vectors for deleted files in a scoped block
-        // so the store lock is released before self.index() re-acquires it
-        let mut deleted_count = 0;
-        {
-            let mut store = self.open_store()?;
-
-            for rel_path in &deleted {
-                if let Some(entry) = manifest.files.remove(rel_path) {
-                    for block_id in &entry.blocks {
-                        let _ = store.delete(block_id);
-                    }
-                    deleted_count += entry.blocks.len();
-                }
-            }
-
-            if deleted_count > 0 {
-                store.flush()?;
-                manifest.save(&self.index_dir)?;
-            }
-        }
+    /// Staleness check that reads only files whose mtime changed, hashing them
+    /// in parallel. Returns (changed paths, deleted rel_paths, skipped), where
+    /// skipped counts candidates dropped as binary or unreadable.
+    pub fn get_stale_files_checked(
+        &self,
+        metadata: &HashMap<PathBuf, walker::FileMetadata>,
+    ) -> Result<(Vec<PathBuf>, Vec<String>, usize)> {
+        let manifest = Manifest::load(&self.index_dir)?;
+        let (maybe_changed, deleted) = self.mtime_diff(metadata, &manifest);
 
-        // Re-index changed files (opens store internally)
-        let changed_files: HashMap<PathBuf, (String, u64)> = changed
+        let checked = self.hash_check(&maybe_changed, metadata, &manifest);
+        let skipped = maybe_changed.len() - checked.len();
+        let changed = checked
             .into_iter()
-            .filter_map(|p| files.get(&p).map(|c| (p, c.clone())))
+            .filter(|(_, _, _, fresh)| fresh.is_some())
+            .map(|(path, ..)| path.to_path_buf())
             .collect();
 
-        let mut stats = self.index(&changed_files, None)?;
-        stats.deleted += deleted_count;
-        Ok(stats)
+        Ok((changed, deleted, skipped))
+    }
+
+    /// Read and hash candidate files in parallel; mtime comes from scan_metadata's
+    /// stat. Binary or unreadable files are dropped. Returns
+    /// (path, rel_path, mtime, Some((content, hash))), with None in place of
+    /// content and hash when the file was touched but its hash is unchanged.
+    #[allow(clippy::type_complexity)]
+    fn hash_check<'a>(
+        &self,
+        candidates: &'a [PathBuf],
+        metadata: &HashMap<PathBuf, walker::FileMetadata>,
+        manifest: &Manifest,
+    ) -> Vec<(&'a Path, String, u64, Option<(String, String)>)> {
+        candidates
+            .par_iter()
+            .filter_map(|path| {
+                let mtime = metadata.get(path).map(|&(_size, mt)| mt).unwrap_or(0);
+                let content = walker::read_text(path)?;
+                let rel_path = self.to_relative(path);
+                let hash = hash_content(&content);
+                let unchanged = manifest
+                    .files
+                    .get(&rel_path)
+                    .is_some_and(|entry| entry.hash == hash);
+                Some((
+                    path.as_path(),
+                    rel_path,
+                    mtime,
+                    (!unchanged).then_some((content, hash)),
+                ))
+            })
+            .collect()
     }
 
     /// Delete the entire index.
@@ -642,47 +768,29 @@ impl SemanticIndex {
         }
 
         store.flush()?;
-        manifest.save(&self.index_dir)?;
+        self.save_manifest(&manifest)?;
 
         Ok(stats)
     }
 
-    fn result_from_omendb(&self, r: &omendb::SearchResult) -> SearchResult {
+    /// Whether a stored result lies within the search scope (if any).
+    fn in_scope(&self, r: &omendb::SearchResult) -> bool {
+        let Some(scope) = &self.search_scope else {
+            return true;
+        };
         let file = r
             .metadata
             .get("file")
             .and_then(|v| v.as_str())
             .unwrap_or("");
-        SearchResult {
-            file: self.to_absolute(file),
-            block_type: r
-                .metadata
-                .get("type")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string(),
-            name: r
-                .metadata
-                .get("name")
-                .and_then(|v| v.as_str())
-                .unwrap_or("")
-                .to_string(),
-            line: r
-                .metadata
-                .get("start_line")
-                .and_then(|v| v.as_u64())
-                .unwrap_or(0) as usize,
-            end_line: r
-                .metadata
-                .get("end_line")
-                .and_then(|v| v.as_u64())
-                .unwrap_or(0) as usize,
-            content: r
-                .metadata
-                .get("content")
-                .and_then(|v| v.as_str())
-                .map(|s| s.to_string()),
-            score: r.distance,
+        file.strip_prefix(scope.as_str())
+            .is_some_and(|rest| rest.is_empty() || rest.starts_with('/'))
+    }
+
+    /// Make root-relative result paths absolute.
+    fn absolutize(&self, results: &mut [SearchResult]) {
+        for r in results {
+            r.file = self.to_absolute(&r.file);
         }
     }
 
@@ -701,6 +809,13 @@ impl SemanticIndex {
         }
     }
 
+    /// Save the manifest and drop cached results, which no longer reflect the index.
+    fn save_manifest(&self, manifest: &Manifest) -> Result<()> {
+        manifest.save(&self.index_dir)?;
+        ResultCache::invalidate(&self.index_dir);
+        Ok(())
+    }
+
     /// Open existing multi-vector store (for search/read operations).
     fn open_store(&self) -> Result<omendb::VectorStore> {
         omendb::VectorStore::open(&self.vectors_path).context("Failed to open vector store")
@@ -727,11 +842,24 @@ impl SemanticIndex {
 }
 
 /// Walk up directory tree to find existing index.
+///
+/// `OG_INDEX_ROOT`, set to an absolute indexed directory that contains
+/// `search_path`, is used directly without walking.
 pub fn find_index_root(search_path: &Path) -> (PathBuf, Option<PathBuf>) {
     let search_path = search_path
         .canonicalize()
         .unwrap_or_else(|_| search_path.to_path_buf());
 
+    if let Some(root) = std::env::var_os("OG_INDEX_ROOT").map(PathBuf::from) {
+        let index_dir = root.join(INDEX_DIR);
+        if root.is_absolute()
+            && search_path.starts_with(&root)
+            && index_dir.join("manifest.json").exists()
+        {
+            return (root, Some(index_dir));
+        }
+    }
+
     let mut current = search_path.clone();
     loop {
         let index_dir = current.join(INDEX_DIR);
@@ -769,28 +897,89 @@ pub fn find_parent_index(path: &Path) -> Option<PathBuf> {
 }
 
 /// Find all .og/ directories under path.
+///
+/// Directories are read on all cores. Ignore files are not applied (an index
+/// can live in a gitignored tree); dot-directories other than .og/ are
+/// skipped, and .og/ itself is never descended into.
 pub fn find_subdir_indexes(path: &Path, include_root: bool) -> Vec<PathBuf> {
     let path = path.canonicalize().unwrap_or_else(|_| path.to_path_buf());
-    let mut indexes = Vec::new();
-
-    for entry in walkdir::WalkDir::new(&path).into_iter().filter_entry(|e| {
-        let name = e.file_name().to_string_lossy();
-        !name.starts_with('.') || name == INDEX_DIR
-    }) {
-        let Ok(entry) = entry else { continue };
-        if entry.file_name() == INDEX_DIR && entry.file_type().is_dir() {
-            let idx_path = entry.path().to_path_buf();
-            if idx_path.join("manifest.json").exists()
-                && (include_root || idx_path.parent() != Some(&path))
-            {
-                indexes.push(idx_path);
-            }
-        }
-    }
+    let (tx, rx) = std::sync::mpsc::channel();
+
+    ignore::WalkBuilder::new(&path)
+        .standard_filters(false)
+        .filter_entry(|e| {
+            let name = e.file_name().to_string_lossy();
+            !name.starts_with('.') || name == INDEX_DIR
+        })
+        .build_parallel()
+        .run(|| {
+            let tx = tx.clone();
+            let path = &path;
+            Box::new(move |entry| {
+                let Ok(entry) = entry else {
+                    return ignore::WalkState::Continue;
+                };
+                if entry.file_name() != INDEX_DIR || entry.file_type().is_none_or(|ft| !ft.is_dir())
+                {
+                    return ignore::WalkState::Continue;
+                }
+                let idx_path = entry.path();
+                if idx_path.join("manifest.json").exists()
+                    && (include_root || idx_path.parent() != Some(path.as_path()))
+                {
+                    let _ = tx.send(idx_path.to_path_buf());
+                }
+                ignore::WalkState::Skip
+            })
+        });
+    drop(tx);
 
+    let mut indexes: Vec<PathBuf> = rx.into_iter().collect();
+    indexes.sort();
     indexes
 }
 
+/// Normalized BM25 query text: identifiers split, synonyms expanded.
+fn bm25_query(query: &str) -> String {
+    crate::synonyms::expand_query(&split_identifiers(query))
+}
+
+/// Convert an omendb hit to a SearchResult, keeping the stored root-relative path.
+fn result_from_omendb(r: &omendb::SearchResult) -> SearchResult {
+    result_from_metadata(&r.metadata, r.distance)
+}
+
+/// Build a result from stored block metadata. Paths stay as stored (relative).
+fn result_from_metadata(metadata: &serde_json::Value, score: f32) -> SearchResult {
+    let file = metadata.get("file").and_then(|v| v.as_str()).unwrap_or("");
+    SearchResult {
+        file: file.to_string(),
+        block_type: metadata
+            .get("type")
+            .and_then(|v| v.as_str())
+            .unwrap_or("")
+            .to_string(),
+        name: metadata
+            .get("name")
+            .and_then(|v| v.as_str())
+            .unwrap_or("")
+            .to_string(),
+        line: metadata
+            .get("start_line")
+            .and_then(|v| v.as_u64())
+            .unwrap_or(0) as usize,
+        end_line: metadata
+            .get("end_line")
+            .and_then(|v| v.as_u64())
+            .unwrap_or(0) as usize,
+        content: metadata
+            .get("content")
+            .and_then(|v| v.as_str())
+            .map(|s| s.to_string()),
+        score,
+    }
+}
+
 fn find_block_by_name(
     store: &omendb::VectorStore,
     block_ids: &[String],
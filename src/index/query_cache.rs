@@ -0,0 +1,145 @@
+use std::fs::File;
+use std::path::{Path, PathBuf};
+use std::time::SystemTime;
+
+use ndarray::Array2;
+
+use crate::embedder;
+
+const QUERY_CACHE_DIR: &str = "query_cache";
+
+/// Maximum cached query embeddings; least recently used entries are evicted beyond this.
+const MAX_ENTRIES: usize = 1024;
+
+/// Header: nrows (u32 LE) + ncols (u32 LE), followed by nrows * ncols f32 LE values.
+const HEADER_LEN: usize = 8;
+
+/// On-disk cache of query token embeddings, one file per query.
+///
+/// Keyed by blake3(model version + query text), so entries never outlive a
+/// model change. Exact-match only: no false positives. All I/O is best-effort;
+/// a broken cache degrades to re-embedding, never to an error.
+pub struct QueryCache {
+    dir: PathBuf,
+}
+
+impl QueryCache {
+    pub fn new(index_dir: &Path) -> Self {
+        Self {
+            dir: index_dir.join(QUERY_CACHE_DIR),
+        }
+    }
+
+    /// Look up a cached query embedding. Refreshes the entry's mtime for LRU eviction.
+    pub fn get(&self, query: &str) -> Option<Array2<f32>> {
+        let path = self.entry_path(query);
+        let raw = std::fs::read(&path).ok()?;
+        let tokens = decode(&raw)?;
+
+        if let Ok(file) = File::options().write(true).open(&path) {
+            let _ = file.set_modified(SystemTime::now());
+        }
+
+        Some(tokens)
+    }
+
+    /// Store a query embedding, evicting the oldest entries if over capacity.
+    pub fn put(&self, query: &str, tokens: &Array2<f32>) {
+        if std::fs::create_dir_all(&self.dir).is_err() {
+            return;
+        }
+
+        // Atomic write: temp file + rename so readers never see a partial entry
+        let path = self.entry_path(query);
+        let tmp_path = path.with_extension("tmp");
+        if std::fs::write(&tmp_path, encode(tokens)).is_err()
+            || std::fs::rename(&tmp_path, &path).is_err()
+        {
+            let _ = std::fs::remove_file(&tmp_path);
+            return;
+        }
+
+        self.evict();
+    }
+
+    fn entry_path(&self, query: &str) -> PathBuf {
+        let mut hasher = blake3::Hasher::new();
+        hasher.update(embedder::MODEL.version.as_bytes());
+        hasher.update(&[0]);
+        hasher.update(query.as_bytes());
+        let key = hasher.finalize().to_hex();
+        self.dir.join(format!("{}.bin", &key[..32]))
+    }
+
+    fn evict(&self) {
+        let Ok(entries) = std::fs::read_dir(&self.dir) else {
+            return;
+        };
+
+        let mut files: Vec<(SystemTime, PathBuf)> = entries
+            .filter_map(|e| e.ok())
+            .filter_map(|e| {
+                let mtime = e.metadata().and_then(|m| m.modified()).ok()?;
+                Some((mtime, e.path()))
+            })
+            .collect();
+
+        if files.len() <= MAX_ENTRIES {
+            return;
+        }
+
+        files.sort_by_key(|(mtime, _)| *mtime);
+        let excess = files.len() - MAX_ENTRIES;
+        for (_, path) in files.into_iter().take(excess) {
+            let _ = std::fs::remove_file(path);
+        }
+    }
+}
+
+fn encode(tokens: &Array2<f32>) -> Vec<u8> {
+    let (nrows, ncols) = tokens.dim();
+    let mut buf = Vec::with_capacity(HEADER_LEN + nrows * ncols * 4);
+    buf.extend_from_slice(&(nrows as u32).to_le_bytes());
+    buf.extend_from_slice(&(ncols as u32).to_le_bytes());
+    for v in tokens.iter() {
+        buf.extend_from_slice(&v.to_le_bytes());
+    }
+    buf
+}
+
+fn decode(raw: &[u8]) -> Option<Array2<f32>> {
+    let header = raw.get(..HEADER_LEN)?;
+    let nrows = u32::from_le_bytes(header[0..4].try_into().ok()?) as usize;
+    let ncols = u32::from_le_bytes(header[4..8].try_into().ok()?) as usize;
+
+    let body = &raw[HEADER_LEN..];
+    if nrows == 0 || body.len() != nrows.checked_mul(ncols)?.checked_mul(4)? {
+        return None;
+    }
+
+    let values: Vec<f32> = body
+        .chunks_exact(4)
+        .map(|b| f32::from_le_bytes([b[0], b[1], b[2], b[3]]))
+        .collect();
+    Array2::from_shape_vec((nrows, ncols), values).ok()
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn roundtrip() {
+        let tokens = Array2::from_shape_vec((2, 3), vec![0.1, -0.2, 0.3, 0.4, 0.5, -0.6]).unwrap();
+        let decoded = decode(&encode(&tokens)).unwrap();
+        assert_eq!(decoded, tokens);
+    }
+
+    #[test]
+    fn rejects_truncated() {
+        let tokens = Array2::from_shape_vec((2, 2), vec![1.0, 2.0, 3.0, 4.0]).unwrap();
+        let raw = encode(&tokens);
+        assert!(decode(&raw[..raw.len() - 1]).is_none());
+        assert!(decode(&raw[..4]).is_none());
+    }
+}
@@ -0,0 +1,157 @@
+use std::path::{Path, PathBuf};
+
+use anyhow::Result;
+use serde::{Deserialize, Serialize};
+
+use crate::embedder;
+
+const RESULT_CACHE_FILE: &str = "result_cache.json";
+
+/// Maximum cached queries; oldest entries are dropped beyond this.
+const MAX_ENTRIES: usize = 256;
+
+#[derive(Default, Serialize, Deserialize)]
+struct CacheFile {
+    model: String,
+    entries: Vec<CachedQuery>,
+}
+
+#[derive(Serialize, Deserialize)]
+struct CachedQuery {
+    /// Normalized BM25 query text.
+    bm25: String,
+    scope: Option<String>,
+    k: usize,
+    /// (block id, score) per result, best first. Blocks are read back from the
+    /// store on a hit, so the file never carries block content.
+    hits: Vec<(String, f32)>,
+}
+
+/// Cache of search results for repeated queries.
+///
+/// Keyed by (BM25 query text, search scope, k). Exact-match only: a hit is
+/// what the same search would return against the same index state. Persisted
+/// in the index directory and dropped whenever the index changes.
+pub struct ResultCache {
+    path: PathBuf,
+    file: CacheFile,
+}
+
+impl ResultCache {
+    /// Load the cache for an index. Missing, corrupt, or other-model caches load empty.
+    pub fn load(index_dir: &Path) -> Self {
+        let path = index_dir.join(RESULT_CACHE_FILE);
+        let file = std::fs::read(&path)
+            .ok()
+            .and_then(|raw| serde_json::from_slice::<CacheFile>(&raw).ok())
+            .filter(|f| f.model == embedder::MODEL.version)
+            .unwrap_or_else(|| CacheFile {
+                model: embedder::MODEL.version.to_string(),
+                entries: Vec::new(),
+            });
+
+        Self { path, file }
+    }
+
+    /// Delete the persisted cache (call after any index write).
+    pub fn invalidate(index_dir: &Path) {
+        let _ = std::fs::remove_file(index_dir.join(RESULT_CACHE_FILE));
+    }
+
+    /// Return cached (block id, score) hits for this exact query, scope, and k.
+    pub fn lookup(&self, bm25: &str, scope: Option<&str>, k: usize) -> Option<Vec<(String, f32)>> {
+        self.file
+            .entries
+            .iter()
+            .find(|e| e.bm25 == bm25 && e.scope.as_deref() == scope && e.k == k)
+            .map(|e| e.hits.clone())
+    }
+
+    /// Add a query's (block id, score) hits to the cache.
+    pub fn insert(
+        &mut self,
+        bm25: String,
+        scope: Option<String>,
+        k: usize,
+        hits: Vec<(String, f32)>,
+    ) {
+        self.file
+            .entries
+            .retain(|e| !(e.bm25 == bm25 && e.scope == scope && e.k == k));
+        self.file.entries.push(CachedQuery {
+            bm25,
+            scope,
+            k,
+            hits,
+        });
+
+        if self.file.entries.len() > MAX_ENTRIES {
+            let excess = self.file.entries.len() - MAX_ENTRIES;
+            self.file.entries.drain(..excess);
+        }
+    }
+
+    /// Persist the cache (atomic write).
+    pub fn save(&self) -> Result<()> {
+        let tmp_path = self.path.with_extension("json.tmp");
+        std::fs::write(&tmp_path, serde_json::to_vec(&self.file)?)?;
+        std::fs::rename(&tmp_path, &self.path)?;
+        Ok(())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn hits(ids: &[&str]) -> Vec<(String, f32)> {
+        ids.iter().map(|id| (id.to_string(), 1.0)).collect()
+    }
+
+    #[test]
+    fn hit_on_same_query() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let mut cache = ResultCache::load(tmp.path());
+        cache.insert("q".to_string(), None, 10, hits(&["a", "b"]));
+
+        assert_eq!(cache.lookup("q", None, 10), Some(hits(&["a", "b"])));
+    }
+
+    #[test]
+    fn miss_on_other_text_scope_or_k() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let mut cache = ResultCache::load(tmp.path());
+        cache.insert("q".to_string(), None, 10, hits(&["a"]));
+
+        assert!(cache.lookup("r", None, 10).is_none());
+        assert!(cache.lookup("q", Some("src"), 10).is_none());
+        assert!(cache.lookup("q", None, 5).is_none());
+        assert!(cache.lookup("q", None, 20).is_none());
+    }
+
+    #[test]
+    fn reinsert_replaces_entry() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let mut cache = ResultCache::load(tmp.path());
+        cache.insert("q".to_string(), None, 10, hits(&["a"]));
+        cache.insert("q".to_string(), None, 10, hits(&["b"]));
+
+        assert_eq!(cache.file.entries.len(), 1);
+        assert_eq!(cache.lookup("q", None, 10), Some(hits(&["b"])));
+    }
+
+    #[test]
+    fn persists_and_invalidates() {
+        let tmp = tempfile::TempDir::new().unwrap();
+        let mut cache = ResultCache::load(tmp.path());
+        cache.insert("q".to_string(), None, 10, hits(&["a"]));
+        cache.save().unwrap();
+
+        let reloaded = ResultCache::load(tmp.path());
+        assert!(reloaded.lookup("q", None, 10).is_some());
+
+        ResultCache::invalidate(tmp.path());
+        let cleared = ResultCache::load(tmp.path());
+        assert!(cleared.lookup("q", None, 10).is_none());
+    }
+}
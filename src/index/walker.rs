@@ -1,9 +1,11 @@
 use std::collections::HashMap;
+use std::fs::Metadata;
 use std::path::{Path, PathBuf};
+use std::sync::mpsc;
 use std::time::SystemTime;
 
 use anyhow::Result;
-use ignore::WalkBuilder;
+use ignore::{WalkBuilder, WalkState};
 
 /// Maximum file size to index (1MB).
 const MAX_FILE_SIZE: u64 = 1_000_000;
@@ -91,104 +93,101 @@ fn should_skip(path: &Path) -> bool {
     false
 }
 
-/// Build a directory walker with standard filtering options.
-fn build_walker(root: &Path) -> ignore::Walk {
+/// Build a parallel directory walker with standard filtering options.
+///
+/// The file size limit is not set here: `ignore` would stat every file to
+/// enforce it, and `walk_files` already stats each file once for mtime.
+fn build_walker(root: &Path) -> ignore::WalkParallel {
     WalkBuilder::new(root)
         .hidden(true)
         .git_ignore(true)
         .git_global(true)
         .git_exclude(true)
         .follow_links(false)
-        .max_filesize(Some(MAX_FILE_SIZE))
-        .build()
+        .build_parallel()
+}
+
+/// Modification time in whole seconds since the Unix epoch (0 if unavailable).
+fn mtime_secs(meta: &Metadata) -> u64 {
+    meta.modified()
+        .unwrap_or(SystemTime::UNIX_EPOCH)
+        .duration_since(SystemTime::UNIX_EPOCH)
+        .map(|d| d.as_secs())
+        .unwrap_or(0)
+}
+
+/// Walk eligible files on all cores, collecting `visit(path, metadata)` for each.
+/// Each file is stat'd exactly once; the same metadata drives the size limit
+/// and is handed to `visit` so callers never stat again.
+fn walk_files<T, F>(root: &Path, visit: F) -> HashMap<PathBuf, T>
+where
+    T: Send,
+    F: Fn(&Path, &Metadata) -> Option<T> + Sync,
+{
+    let (tx, rx) = mpsc::channel();
+
+    build_walker(root).run(|| {
+        let tx = tx.clone();
+        let visit = &visit;
+        Box::new(move |entry| {
+            let Ok(entry) = entry else {
+                return WalkState::Continue;
+            };
+            if entry.file_type().is_none_or(|ft| !ft.is_file()) {
+                return WalkState::Continue;
+            }
+
+            let path = entry.path();
+            if should_skip(path) {
+                return WalkState::Continue;
+            }
+
+            let Ok(meta) = std::fs::metadata(path) else {
+                return WalkState::Continue;
+            };
+            if meta.len() > MAX_FILE_SIZE {
+                return WalkState::Continue;
+            }
+
+            if let Some(value) = visit(path, &meta) {
+                let _ = tx.send((path.to_path_buf(), value));
+            }
+            WalkState::Continue
+        })
+    });
+    drop(tx);
+
+    rx.into_iter().collect()
 }
 
 /// Scan directory tree for file metadata only (no content reads).
 /// Returns path -> (file_size, mtime_secs) for each eligible file.
 pub fn scan_metadata(root: &Path) -> Result<HashMap<PathBuf, FileMetadata>> {
-    let mut results = HashMap::new();
-
-    for entry in build_walker(root) {
-        let entry = match entry {
-            Ok(e) => e,
-            Err(_) => continue,
-        };
-
-        if entry.file_type().is_none_or(|ft| !ft.is_file()) {
-            continue;
-        }
+    Ok(walk_files(root, |_path, meta| {
+        Some((meta.len(), mtime_secs(meta)))
+    }))
+}
 
-        let path = entry.path();
-        if should_skip(path) {
-            continue;
-        }
+/// Read a file as UTF-8 text. None if unreadable, binary, or not valid UTF-8.
+pub fn read_text(path: &Path) -> Option<String> {
+    let raw = std::fs::read(path).ok()?;
 
-        if let Ok(meta) = std::fs::metadata(path) {
-            let size = meta.len();
-            let mtime = meta
-                .modified()
-                .unwrap_or(SystemTime::UNIX_EPOCH)
-                .duration_since(SystemTime::UNIX_EPOCH)
-                .map(|d| d.as_secs())
-                .unwrap_or(0);
-            results.insert(path.to_path_buf(), (size, mtime));
-        }
+    // Binary detection: null byte in first 8192 bytes
+    let check_len = raw.len().min(8192);
+    if raw[..check_len].contains(&0) {
+        return None;
     }
 
-    Ok(results)
-}
-
-/// Get mtime for a single file path.
-pub fn file_mtime(path: &Path) -> u64 {
-    std::fs::metadata(path)
-        .and_then(|m| m.modified())
-        .unwrap_or(SystemTime::UNIX_EPOCH)
-        .duration_since(SystemTime::UNIX_EPOCH)
-        .map(|d| d.as_secs())
-        .unwrap_or(0)
+    String::from_utf8(raw).ok()
 }
 
 /// Scan directory tree for text files, returning path -> (content, mtime).
 /// mtime is captured before reading content so it's never newer than what was read.
 pub fn scan(root: &Path) -> Result<HashMap<PathBuf, (String, u64)>> {
-    let mut results = HashMap::new();
-
-    for entry in build_walker(root) {
-        let entry = match entry {
-            Ok(e) => e,
-            Err(_) => continue,
-        };
-
-        if entry.file_type().is_none_or(|ft| !ft.is_file()) {
-            continue;
-        }
-
-        let path = entry.path();
-        if should_skip(path) {
-            continue;
-        }
-
-        // Stat before read so mtime is never newer than the content we index
-        let mtime = file_mtime(path);
-
-        let raw = match std::fs::read(path) {
-            Ok(data) => data,
-            Err(_) => continue,
-        };
-
-        // Binary detection: null byte in first 8192 bytes
-        let check_len = raw.len().min(8192);
-        if raw[..check_len].contains(&0) {
-            continue;
-        }
-
-        let content = match String::from_utf8(raw) {
-            Ok(s) => s,
-            Err(_) => continue,
-        };
-
-        results.insert(path.to_path_buf(), (content, mtime));
-    }
-
-    Ok(results)
+    Ok(walk_files(root, |path, meta| {
+        // Stat happened before read so mtime is never newer than the content we index
+        let mtime = mtime_secs(meta);
+        let content = read_text(path)?;
+        Some((content, mtime))
+    }))
 }
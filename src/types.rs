@@ -51,6 +51,22 @@ pub struct SearchResult {
     pub score: f32,
 }
 
+#[cfg(test)]
+impl SearchResult {
+    /// Test fixture: a function block `f` in `file` with score 1.0.
+    pub fn in_file(file: &str) -> Self {
+        Self {
+            file: file.to_string(),
+            block_type: "function".to_string(),
+            name: "f".to_string(),
+            line: 1,
+            end_line: 2,
+            content: None,
+            score: 1.0,
+        }
+    }
+}
+
 /// Parsed file reference from CLI input.
 #[derive(Debug, Clone)]
 pub enum FileRef {
@@ -69,6 +85,8 @@ pub enum OutputFormat {
     Default,
     /// JSON output.
     Json,
+    /// JSON Lines: one compact object per result, streamable.
+    JsonLines,
     /// NoContent: JSON without content field.
     NoContent,
     /// Files only: unique file paths.
@@ -76,11 +94,13 @@ pub enum OutputFormat {
 }
 
 impl OutputFormat {
-    pub fn from_flags(json: bool, files_only: bool, no_content: bool) -> Self {
+    pub fn from_flags(json: bool, jsonl: bool, files_only: bool, no_content: bool) -> Self {
         if files_only {
             Self::FilesOnly
         } else if json {
             Self::Json
+        } else if jsonl {
+            Self::JsonLines
         } else if no_content {
             Self::NoContent
         } else {
@@ -124,6 +124,57 @@ fn search_json_output() {
     assert!(first.get("score").is_some());
 }
 
+#[test]
+fn search_jsonl_output() {
+    let tmp = build_fixture_index();
+    let path = tmp.path().to_str().unwrap();
+
+    let output = og()
+        .args(["--jsonl", "error", path, "-n", "2"])
+        .assert()
+        .success();
+
+    let stdout = String::from_utf8(output.get_output().stdout.clone()).unwrap();
+    let lines: Vec<&str> = stdout.lines().collect();
+    assert!(!lines.is_empty());
+    for line in lines {
+        let parsed: serde_json::Value = serde_json::from_str(line).unwrap();
+        assert!(parsed.is_object());
+        assert!(parsed.get("file").is_some());
+    }
+
+    // No results: nothing on stdout, not even an empty array
+    let out = og()
+        .args(["--jsonl", "-e", "zzzznomatchzzzz", "error", path])
+        .output()
+        .unwrap();
+    assert!(out.stdout.is_empty());
+}
+
+#[test]
+fn search_elbow_flag() {
+    let tmp = build_fixture_index();
+    let path = tmp.path().to_str().unwrap();
+
+    // A bare --elbow before the query must not take the query as its DELTA
+    og().args(["--elbow", "error handling", path])
+        .assert()
+        .success()
+        .stdout(predicate::str::contains("errors.rs"));
+
+    let all = og()
+        .args(["--json", "-n", "10", "function", path])
+        .output()
+        .unwrap();
+    let cut = og()
+        .args(["--elbow=0.3", "--json", "-n", "10", "function", path])
+        .output()
+        .unwrap();
+    assert!(cut.status.success());
+    let (all, cut) = (json_files(&all.stdout), json_files(&cut.stdout));
+    assert!(!cut.is_empty() && cut.len() <= all.len());
+}
+
 #[test]
 fn search_files_only() {
     let tmp = build_fixture_index();
@@ -221,6 +272,90 @@ fn incremental_update() {
         .stderr(predicate::str::contains("Updating"));
 }
 
+#[test]
+fn update_check_without_interval_leaves_no_stamp() {
+    let tmp = build_fixture_index();
+    let path = tmp.path().to_str().unwrap();
+
+    std::fs::write(tmp.path().join("first.py"), "def first():\n    pass\n").unwrap();
+    og().env_remove("OG_CHECK_INTERVAL")
+        .args(["first", path])
+        .assert()
+        .success()
+        .stderr(predicate::str::contains("Updating"));
+    assert!(!tmp.path().join(".og/last_check").exists());
+
+    // Every search keeps checking for changes
+    std::fs::write(tmp.path().join("second.py"), "def second():\n    pass\n").unwrap();
+    og().env_remove("OG_CHECK_INTERVAL")
+        .args(["second", path])
+        .assert()
+        .success()
+        .stderr(predicate::str::contains("Updating"));
+}
+
+#[test]
+fn update_check_skipped_within_interval() {
+    let tmp = build_fixture_index();
+    let sub = tmp.path().join("sub");
+    std::fs::create_dir(&sub).unwrap();
+
+    std::fs::write(sub.join("first.py"), "def first():\n    pass\n").unwrap();
+    og().env("OG_CHECK_INTERVAL", "3600")
+        .args(["first", sub.to_str().unwrap()])
+        .assert()
+        .success()
+        .stderr(predicate::str::contains("Using index at"))
+        .stderr(predicate::str::contains("Updating"));
+    assert!(tmp.path().join(".og/last_check").exists());
+
+    // Checked moments ago: the new file is not picked up, but the notice still shows
+    std::fs::write(sub.join("second.py"), "def second():\n    pass\n").unwrap();
+    og().env("OG_CHECK_INTERVAL", "3600")
+        .args(["first", sub.to_str().unwrap()])
+        .assert()
+        .success()
+        .stderr(predicate::str::contains("Using index at"))
+        .stderr(predicate::str::contains("Updating").not());
+}
+
+#[test]
+fn index_root_env_overrides_walk_up() {
+    let outer = build_fixture_index();
+    let root = outer.path().canonicalize().unwrap();
+    let sub = root.join("sub");
+    std::fs::create_dir(&sub).unwrap();
+    std::fs::write(sub.join("helper.py"), "def quuxhelper():\n    pass\n").unwrap();
+
+    // Give sub its own index: build refuses to nest under a parent index
+    std::fs::rename(root.join(".og"), root.join(".og_hold")).unwrap();
+    og().args(["build", sub.to_str().unwrap()])
+        .assert()
+        .success();
+    std::fs::rename(root.join(".og_hold"), root.join(".og")).unwrap();
+
+    // Absolute root containing the search path: its index wins over sub's
+    og().env("OG_INDEX_ROOT", &root)
+        .args(["quuxhelper", sub.to_str().unwrap()])
+        .assert()
+        .success()
+        .stderr(predicate::str::contains(format!(
+            "Using index at {}",
+            root.display()
+        )));
+
+    // Relative or non-containing roots are ignored: walk-up finds sub's index
+    let other = build_fixture_index();
+    for value in [std::ffi::OsStr::new("."), other.path().as_os_str()] {
+        og().current_dir(&root)
+            .env("OG_INDEX_ROOT", value)
+            .args(["quuxhelper", sub.to_str().unwrap()])
+            .assert()
+            .success()
+            .stderr(predicate::str::contains("Using index at").not());
+    }
+}
+
 #[test]
 fn camel_case_query_matches() {
     let tmp = build_fixture_index();